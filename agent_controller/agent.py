@@ -6,8 +6,8 @@ import ollama
 
 from agent_controller.model_router import ModelRouter
 from agent_controller.mcp_client import MCPClient
+from shared.logging_utils import summarize
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class LocalAgent:
@@ -98,7 +98,7 @@ class LocalAgent:
         else:
             self.current_model = self.model_router.select_model(user_message)
         
-        logger.info(f"Using model: {self.current_model}")
+        logger.info("Using model: %s", self.current_model)
         
         # Add user message to history
         self.conversation_history.append({
@@ -118,7 +118,7 @@ class LocalAgent:
             self.conversation_history.append(assistant_message)
             
             if assistant_message.get('tool_calls'):
-                logger.info(f"Model requested {len(assistant_message['tool_calls'])} tool calls")
+                logger.info("Model requested %d tool calls", len(assistant_message['tool_calls']))
                 
                 # Execute each tool call via MCP client
                 for tool_call in assistant_message['tool_calls']:
@@ -127,6 +127,7 @@ class LocalAgent:
                     
                     # Execute tool via MCP client
                     tool_result = self.mcp_client.call_tool(function_name, function_args)
+                    logger.debug("Tool %s returned: %s", function_name, summarize(tool_result))
                     
                     # Add tool result to conversation
                     self.conversation_history.append({
@@ -149,7 +150,7 @@ class LocalAgent:
                 return assistant_message['content']
         
         except Exception as e:
-            logger.error(f"Error in chat: {e}")
+            logger.error("Error in chat: %s", e)
             raise
     
     def reset(self):
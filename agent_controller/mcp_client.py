@@ -3,6 +3,8 @@
 import logging
 from typing import Dict, Any
 
+from shared.logging_utils import summarize
+
 logger = logging.getLogger(__name__)
 
 class MCPClient:
@@ -43,7 +45,7 @@ class MCPClient:
         # Phase 2: Will send to actual MCP server
         from pathlib import Path
         
-        logger.info(f"Calling tool: {tool_name} with args: {arguments}")
+        logger.info("Calling tool: %s with args: %s", tool_name, summarize(arguments), extra={"tool": tool_name})
         
         try:
             if tool_name == "file_read":
@@ -67,7 +69,7 @@ class MCPClient:
                 return f"Unknown tool: {tool_name}"
         
         except Exception as e:
-            logger.error(f"Error executing tool: {e}")
+            logger.error("Error executing tool %s: %s", tool_name, e, extra={"tool": tool_name})
             return f"Error: {str(e)}"
     
     def list_tools(self) -> list:
@@ -0,0 +1,118 @@
+"""Benchmark - tool call throughput with multi-MB payloads under each logging setup
+
+Compares the old setup (f-string of the full arguments written synchronously
+on the calling thread) against shared.logging_utils (lazy, truncated
+arguments written by a background QueueListener).
+
+Each measurement starts with an untimed warm-up call and is repeated
+`--repeats` times; the median is reported. Setups are interleaved within
+each repeat, with a rotating start, so drift in disk or CPU state does not
+favour whichever setup happens to run last.
+
+Usage:
+    python -m benchmarks.bench_tool_logging [--sizes 1 4 16] [--calls 20] [--repeats 7]
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from agent_controller.mcp_client import MCPClient
+from shared.logging_utils import setup_logging, shutdown_logging
+
+# Kept outside the agent_controller hierarchy so muting the client logger
+# in bench_legacy does not mute this one too
+legacy_logger = logging.getLogger("bench.legacy")
+
+
+def _reset_root():
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def _run(client: MCPClient, target: Path, payload: str, calls: int, legacy: bool) -> float:
+    arguments = {"path": str(target), "content": payload}
+    client.call_tool("file_write", arguments)
+    start = time.perf_counter()
+    for _ in range(calls):
+        if legacy:
+            legacy_logger.info(f"Calling tool: file_write with args: {arguments}")
+        client.call_tool("file_write", arguments)
+    return time.perf_counter() - start
+
+
+def bench_legacy(client: MCPClient, workdir: Path, payload: str, calls: int) -> float:
+    """
+    Old behaviour: full arguments formatted eagerly and written on the calling thread
+
+    The old code logged through basicConfig's stderr StreamHandler; a
+    FileHandler stands in for it here so the benchmark does not flood the
+    terminal and the bytes written can be checked.
+    """
+    _reset_root()
+    handler = logging.FileHandler(workdir / "legacy.log", encoding="utf-8")
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    # The client's own (new-style) log line is muted so only the legacy line is paid for
+    logging.getLogger("agent_controller.mcp_client").setLevel(logging.WARNING)
+    try:
+        return _run(client, workdir / "out.txt", payload, calls, legacy=True)
+    finally:
+        logging.getLogger("agent_controller.mcp_client").setLevel(logging.NOTSET)
+        _reset_root()
+
+
+def bench_queued(client: MCPClient, workdir: Path, payload: str, calls: int) -> float:
+    """New behaviour: summarized arguments handed to a QueueListener"""
+    _reset_root()
+    setup_logging(log_dir=str(workdir / "logs"), console=False)
+    try:
+        return _run(client, workdir / "out.txt", payload, calls, legacy=False)
+    finally:
+        shutdown_logging()
+
+
+def bench_disabled(client: MCPClient, workdir: Path, payload: str, calls: int) -> float:
+    """Baseline: logging disabled entirely"""
+    _reset_root()
+    logging.disable(logging.CRITICAL)
+    try:
+        return _run(client, workdir / "out.txt", payload, calls, legacy=False)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16], help="Payload sizes in MB")
+    parser.add_argument("--calls", type=int, default=20, help="Tool calls per measurement")
+    parser.add_argument("--repeats", type=int, default=7, help="Measurements per setup; the median is reported")
+    args = parser.parse_args()
+
+    client = MCPClient()
+    benches = [("disabled", bench_disabled), ("legacy", bench_legacy), ("queued", bench_queued)]
+
+    print(f"{'size':>6} {'setup':>9} {'calls/s':>9} {'MB/s':>9} {'ms/call':>9}")
+    for size_mb in args.sizes:
+        payload = "x" * (size_mb * 1024 * 1024)
+        timings: dict[str, list[float]] = {label: [] for label, _ in benches}
+        for repeat in range(args.repeats):
+            shift = repeat % len(benches)
+            for label, bench in benches[shift:] + benches[:shift]:
+                with tempfile.TemporaryDirectory() as tmp:
+                    timings[label].append(bench(client, Path(tmp), payload, args.calls))
+        for label, _ in benches:
+            elapsed = statistics.median(timings[label])
+            rate = args.calls / elapsed
+            print(f"{size_mb:>4}MB {label:>9} {rate:>9.1f} {rate * size_mb:>9.1f} {elapsed / args.calls * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,8 @@ from mcp.server import Server
 from mcp.types import Tool, TextContent
 from pathlib import Path
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+from shared.logging_utils import setup_logging, summarize
+
 logger = logging.getLogger(__name__)
 
 # Create server
@@ -68,7 +68,7 @@ async def list_tools() -> list[Tool]:
 @server.call_tool()
 async def call_tool(name: str, arguments: dict):
     """Execute tool calls"""
-    logger.info(f"Tool called: {name} with args: {arguments}")
+    logger.info("Tool called: %s with args: %s", name, summarize(arguments), extra={"tool": name})
     
     try:
         if name == "file_read":
@@ -92,11 +92,12 @@ async def call_tool(name: str, arguments: dict):
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
     
     except Exception as e:
-        logger.error(f"Error executing tool {name}: {e}")
+        logger.error("Error executing tool %s: %s", name, e, extra={"tool": name})
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 async def main():
     """Run the MCP server"""
+    setup_logging()
     logger.info("Starting MCP server...")
     from mcp.server.stdio import stdio_server
     
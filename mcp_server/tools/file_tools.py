@@ -11,10 +11,10 @@ def file_read(path: str) -> str:
     try:
         file_path = Path(path)
         content = file_path.read_text(encoding='utf-8')
-        logger.info(f"Read file: {path}")
+        logger.info("Read file: %s", path)
         return content
     except Exception as e:
-        logger.error(f"Error reading file {path}: {e}")
+        logger.error("Error reading file %s: %s", path, e)
         raise
 
 
@@ -24,10 +24,10 @@ def file_write(path: str, content: str) -> str:
         file_path = Path(path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(content, encoding='utf-8')
-        logger.info(f"Wrote file: {path}")
+        logger.info("Wrote file: %s", path)
         return f"Successfully wrote to {path}"
     except Exception as e:
-        logger.error(f"Error writing file {path}: {e}")
+        logger.error("Error writing file %s: %s", path, e)
         raise
 
 
@@ -36,8 +36,8 @@ def list_directory(path: str) -> str:
     try:
         dir_path = Path(path)
         items = [item.name for item in dir_path.iterdir()]
-        logger.info(f"Listed directory: {path}")
+        logger.info("Listed directory: %s", path)
         return "\n".join(items)
     except Exception as e:
-        logger.error(f"Error listing directory {path}: {e}")
+        logger.error("Error listing directory %s: %s", path, e)
         raise
\ No newline at end of file
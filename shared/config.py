@@ -15,4 +15,13 @@ MEMORY_DB = "data/memory.db"
 LOG_DIR = "data/logs"
 
 # Model routing keywords
-CODING_KEYWORDS = ["code", "program", "script", "function", "debug", "implement", "write a", "create a"]
\ No newline at end of file
+CODING_KEYWORDS = ["code", "program", "script", "function", "debug", "implement", "write a", "create a"]
+
+# Logging settings
+LOG_FILE = "agent.log"
+LOG_LEVEL = "INFO"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_PREVIEW_CHARS = 200
+LOG_PREVIEW_ITEMS = 20
+LOG_SUMMARY_CHARS = 4000
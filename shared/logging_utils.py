@@ -0,0 +1,272 @@
+"""Logging setup shared by the agent controller and MCP server
+
+The calling thread renders each record's message (and traceback, if any)
+and pushes it onto a queue; a background QueueListener does the file I/O.
+Large values should be wrapped in summarize() so that rendering stays
+bounded. Records are written to LOG_DIR as one JSON object per line with
+size-based rotation.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Optional
+
+from shared.config import (
+    LOG_BACKUP_COUNT,
+    LOG_DIR,
+    LOG_FILE,
+    LOG_LEVEL,
+    LOG_MAX_BYTES,
+    LOG_PREVIEW_CHARS,
+    LOG_PREVIEW_ITEMS,
+    LOG_SUMMARY_CHARS,
+)
+
+# Attributes present on every LogRecord; anything else came in via `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+# Containers nested deeper than this are shown as "..."
+_MAX_DEPTH = 8
+
+_listener: Optional[QueueListener] = None
+_previous_level: Optional[int] = None
+_exc_formatter = logging.Formatter()
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps the message and traceback in separate fields
+
+    The stock prepare() folds the formatted traceback into the message;
+    here it is kept in exc_text so JsonFormatter can emit it on its own.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _Summary:
+    """Lazily rendered, size-bounded view of a value for log messages
+
+    Nothing is rendered unless the record is actually emitted, so calls
+    below the active log level cost only the object allocation.
+    """
+
+    __slots__ = ("value", "limit", "max_items", "max_chars")
+
+    def __init__(self, value: Any, limit: int, max_items: int, max_chars: int):
+        self.value = value
+        self.limit = limit
+        self.max_items = max_items
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        writer = _Writer(self.limit, self.max_items, self.max_chars)
+        writer.render(self.value)
+        text = "".join(writer.parts)
+        if len(text) > self.max_chars:
+            text = f"{text[:self.max_chars]}... <truncated>"
+        return text
+
+    __repr__ = __str__
+
+
+class _Writer:
+    """Accumulates a summary, stopping once `max_chars` have been written"""
+
+    def __init__(self, limit: int, max_items: int, max_chars: int):
+        self.limit = limit
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.parts: list[str] = []
+        self.size = 0
+        self.active: set[int] = set()
+
+    @property
+    def full(self) -> bool:
+        return self.size > self.max_chars
+
+    def write(self, text: str):
+        self.parts.append(text)
+        self.size += len(text)
+
+    def render(self, value: Any):
+        if self.full:
+            return
+        if isinstance(value, str):
+            self.write(_summarize_str(value, self.limit))
+        elif isinstance(value, bytes):
+            preview = value[:self.limit].decode("utf-8", "replace")
+            self.write(f"{_summarize_str(preview, self.limit)} <{len(value)} bytes>")
+        elif isinstance(value, (dict, list, tuple, set, frozenset)):
+            self.render_container(value)
+        else:
+            text = repr(value)
+            self.write(text if len(text) <= self.limit else f"{text[:self.limit]}... <{len(text)} chars>")
+
+    def render_container(self, value):
+        open_, close = ("{", "}") if isinstance(value, dict) else ("[", "]")
+        # Like reprlib, stop at self-references and excessive nesting
+        if id(value) in self.active or len(self.active) >= _MAX_DEPTH:
+            self.write(f"{open_}...{close}")
+            return
+        self.active.add(id(value))
+        try:
+            if isinstance(value, dict):
+                self.render_items(open_, close, value.items(), len(value), mapping=True)
+            else:
+                self.render_items(open_, close, value, len(value), mapping=False)
+        finally:
+            self.active.discard(id(value))
+
+    def render_items(self, open_: str, close: str, items, count: int, mapping: bool):
+        self.write(open_)
+        for index, item in enumerate(items):
+            if index:
+                self.write(", ")
+            if index >= self.max_items or self.full:
+                self.write(f"... <{count} items>")
+                break
+            if mapping:
+                key, item = item
+                self.render(key)
+                self.write(": ")
+            self.render(item)
+        self.write(close)
+
+
+def _summarize_str(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return repr(text)
+    return f"{text[:limit]!r}... <{len(text)} chars>"
+
+
+def summarize(
+    value: Any,
+    limit: int = LOG_PREVIEW_CHARS,
+    max_items: int = LOG_PREVIEW_ITEMS,
+    max_chars: int = LOG_SUMMARY_CHARS,
+) -> _Summary:
+    """
+    Wrap a value so it is logged truncated instead of in full
+
+    Strings longer than `limit` are cut to a preview followed by their
+    length. Dicts, lists, tuples and sets show at most `max_items`
+    entries followed by their length; self-references and deeply nested
+    containers are shown as "...". The whole summary is cut off after
+    `max_chars`, so rendering cost does not grow with payload size.
+
+    Args:
+        value: Value to log (tool arguments, tool results, ...)
+        limit: Maximum number of characters kept per string
+        max_items: Maximum number of entries shown per container
+        max_chars: Maximum length of the rendered summary
+
+    Returns:
+        Object to pass as a %-style logging argument
+    """
+    return _Summary(value, limit, max_items, max_chars)
+
+
+def setup_logging(
+    log_dir: str = LOG_DIR,
+    level: str = LOG_LEVEL,
+    console: bool = True,
+) -> QueueListener:
+    """
+    Route all logging through a queue to a rotating JSON log file
+
+    Safe to call more than once; only the first call installs handlers.
+
+    Args:
+        log_dir: Directory for the log file
+        level: Root logger level
+        console: Also echo records to stderr in plain text
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _previous_level
+    if _listener is not None:
+        return _listener
+
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        Path(log_dir) / LOG_FILE,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JsonFormatter())
+    handlers: list[logging.Handler] = [file_handler]
+
+    if console:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+        handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    _previous_level = root.level
+    root.setLevel(level)
+    root.addHandler(_StructuredQueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records, stop the background listener and restore the root logger"""
+    global _listener, _previous_level
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    root.setLevel(_previous_level)
+    _listener = None
+    _previous_level = None
@@ -0,0 +1,103 @@
+"""Tests for shared logging setup"""
+
+import json
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from agent_controller.mcp_client import MCPClient
+from shared.logging_utils import setup_logging, shutdown_logging, summarize
+from shared.config import LOG_FILE
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Install queued logging into a temp dir and tear it down afterwards"""
+    setup_logging(log_dir=str(tmp_path), console=False)
+    yield tmp_path
+    shutdown_logging()
+
+
+def read_entries(log_dir):
+    shutdown_logging()
+    lines = (log_dir / LOG_FILE).read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def test_summarize_truncates_long_string():
+    text = str(summarize("x" * 5000, limit=10))
+    assert text == "'xxxxxxxxxx'... <5000 chars>"
+
+
+def test_summarize_truncates_bytes():
+    text = str(summarize(b"y" * 900, limit=10))
+    assert text == "'yyyyyyyyyy' <900 bytes>"
+
+
+def test_summarize_caps_container_items():
+    text = str(summarize({"items": list(range(100_000))}, max_items=3))
+    assert text == "{'items': [0, 1, 2, ... <100000 items>]}"
+
+
+def test_summarize_caps_total_length():
+    text = str(summarize([{"k": "v" * 100}] * 50, max_items=50, max_chars=500))
+    assert len(text) <= 500 + len("... <truncated>")
+    assert text.endswith("... <truncated>")
+
+
+def test_summarize_handles_self_reference():
+    items = []
+    items.append(items)
+    assert str(summarize(items)) == "[[...]]"
+
+
+def test_summarize_caps_nesting_depth():
+    nested = []
+    for _ in range(5000):
+        nested = [nested]
+    assert str(summarize(nested)).count("[") < 20
+
+
+def test_extra_fields_become_json_keys(log_dir):
+    logging.getLogger("test").info("Calling tool: %s", "file_read", extra={"tool": "file_read"})
+    entry = read_entries(log_dir)[-1]
+    assert entry["message"] == "Calling tool: file_read"
+    assert entry["tool"] == "file_read"
+
+
+def test_exception_is_separate_json_field(log_dir):
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logging.getLogger("test").exception("boom %s", 1)
+    entry = read_entries(log_dir)[-1]
+    assert entry["message"] == "boom 1"
+    assert "ZeroDivisionError" in entry["exc_info"]
+
+
+def test_setup_logging_is_idempotent(log_dir):
+    setup_logging(log_dir=str(log_dir), console=False)
+    queue_handlers = [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+    assert len(queue_handlers) == 1
+
+
+def test_shutdown_restores_root_level(tmp_path):
+    root = logging.getLogger()
+    previous = root.level
+    root.setLevel(logging.ERROR)
+    try:
+        setup_logging(log_dir=str(tmp_path), console=False)
+        assert root.level == logging.INFO
+        shutdown_logging()
+        assert root.level == logging.ERROR
+    finally:
+        root.setLevel(previous)
+
+
+def test_tool_call_logs_bounded_arguments(log_dir, tmp_path):
+    target = tmp_path / "out.txt"
+    MCPClient().call_tool("file_write", {"path": str(target), "content": "x" * 1_000_000})
+    entry = [e for e in read_entries(log_dir) if e.get("tool") == "file_write"][-1]
+    assert "<1000000 chars>" in entry["message"]
+    assert len(entry["message"]) < 1000
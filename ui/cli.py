@@ -14,6 +14,7 @@ from rich.panel import Panel
 
 from agent_controller.agent import LocalAgent
 from shared.config import DEFAULT_MODEL, CODER_MODEL
+from shared.logging_utils import setup_logging
 
 # Rest of your CLI code stays the same...
 console = Console()
@@ -180,4 +181,5 @@ def display_info(agent: LocalAgent):
 
 
 if __name__ == "__main__":
+    setup_logging()
     app()
\ No newline at end of file